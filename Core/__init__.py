@@ -1,15 +1,30 @@
 # SwiftAgent Toolkit - Core Module
 # This file makes the Core directory a Python package
 
-from .llm_manager import LLMManager, llm_manager
-from .memory_system import MemorySystem, memory_system
-from .self_healing import SelfHealingSystem, self_healing
-
-__all__ = [
-    'LLMManager',
-    'llm_manager', 
-    'MemorySystem',
-    'memory_system',
-    'SelfHealingSystem',
-    'self_healing'
-] 
\ No newline at end of file
+import importlib
+
+# Re-exports are resolved lazily (PEP 562), so importing one subsystem does not
+# import its siblings, and a broken one only fails when it is actually used.
+# Instances named like their submodule (e.g. Core.llm_manager) resolve to the
+# submodule once it has been imported; import those from the submodule itself
+_LAZY_EXPORTS = {
+    'LLMManager': 'llm_manager',
+    'llm_manager': 'llm_manager',
+    'MemorySystem': 'memory_system',
+    'memory_system': 'memory_system',
+    'SelfHealingSystem': 'self_healing',
+    'self_healing': 'self_healing',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
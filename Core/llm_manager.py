@@ -5,6 +5,7 @@ Provides unified interface for all LLM providers with intelligent routing
 """
 
 import asyncio
+import importlib
 import json
 import logging
 import time
@@ -132,8 +133,25 @@ class LLMManager:
         self.usage_stats: Dict[str, Dict] = {}
         self.performance_history: Dict[str, List[float]] = {}
         
+        # Parallel per-provider columns for cheap status scans
+        self.provider_names: List[str] = []
+        self.provider_enabled: List[bool] = []
+        self.provider_type_values: List[str] = []
+        self._provider_index: Dict[str, int] = {}
+        
     def register_provider(self, provider: BaseLLMProvider):
         """Register a new LLM provider"""
+        name = provider.config.name
+        index = self._provider_index.get(name)
+        if index is None:
+            self._provider_index[name] = len(self.provider_names)
+            self.provider_names.append(name)
+            self.provider_enabled.append(provider.config.enabled)
+            self.provider_type_values.append(provider.config.type.value)
+        else:
+            self.provider_enabled[index] = provider.config.enabled
+            self.provider_type_values[index] = provider.config.type.value
+        
         self.providers[provider.config.name] = provider
         self.provider_configs[provider.config.name] = provider.config
         self.usage_stats[provider.config.name] = {
@@ -145,6 +163,13 @@ class LLMManager:
         self.performance_history[provider.config.name] = []
         logger.info(f"Registered provider: {provider.config.name}")
     
+    def set_provider_enabled(self, provider: BaseLLMProvider, enabled: bool):
+        """Enable or disable a provider, keeping the status columns in sync"""
+        provider.config.enabled = enabled
+        index = self._provider_index.get(provider.config.name)
+        if index is not None:
+            self.provider_enabled[index] = enabled
+    
     def get_default_providers(self) -> List[LLMProvider]:
         """Get default provider configurations"""
         return [
@@ -184,31 +209,39 @@ class LLMManager:
             )
         ]
     
-    async def initialize_providers(self):
-        """Initialize all providers"""
-        # Import provider implementations
-        from ..Providers.ollama_provider import OllamaProvider
-        from ..Providers.huggingface_provider import HuggingFaceProvider
-        from ..Providers.groq_provider import GroqProvider
-        from ..Providers.local_ai_provider import LocalAIProvider
+    def load_configs(self) -> Dict[str, BaseLLMProvider]:
+        """Build and register the default providers (synchronous, no network I/O)"""
+        # Provider implementations, imported per provider so one missing
+        # dependency only skips that provider. Types without an implementation
+        # yet (LocalAI) are skipped silently
+        implementations = {
+            ProviderType.OLLAMA: ("Providers.ollama_provider", "OllamaProvider"),
+            ProviderType.HUGGINGFACE: ("Providers.huggingface_provider", "HuggingFaceProvider"),
+            ProviderType.GROQ: ("Providers.groq_provider", "GroqProvider"),
+        }
         
         # Create provider instances
         for config in self.get_default_providers():
+            # Already built (e.g. by the launcher): keep the existing instance
+            # and its HTTP session instead of replacing it
+            if config.name in self.providers:
+                continue
+            
+            if config.type not in implementations:
+                continue
+            
             try:
-                if config.type == ProviderType.OLLAMA:
-                    provider = OllamaProvider(config)
-                elif config.type == ProviderType.HUGGINGFACE:
-                    provider = HuggingFaceProvider(config)
-                elif config.type == ProviderType.GROQ:
-                    provider = GroqProvider(config)
-                elif config.type == ProviderType.LOCAL_AI:
-                    provider = LocalAIProvider(config)
-                else:
-                    continue
-                
-                self.register_provider(provider)
+                module_name, class_name = implementations[config.type]
+                provider_class = getattr(importlib.import_module(module_name), class_name)
+                self.register_provider(provider_class(config))
             except Exception as e:
                 logger.warning(f"Failed to initialize provider {config.name}: {e}")
+        
+        return self.providers
+    
+    async def initialize_providers(self):
+        """Initialize all providers"""
+        self.load_configs()
     
     def select_best_provider(self, request: LLMRequest) -> Optional[BaseLLMProvider]:
         """Select the best provider for a request"""
@@ -296,7 +329,7 @@ class LLMManager:
                 logger.warning(f"Provider {provider.config.name} failed: {e}")
                 
                 # Temporarily disable failed provider
-                provider.config.enabled = False
+                self.set_provider_enabled(provider, False)
                 
                 # Re-enable after delay (exponential backoff)
                 asyncio.create_task(self._re_enable_provider(provider, attempt + 1))
@@ -352,7 +385,7 @@ class LLMManager:
         
         # Check if provider is available before re-enabling
         if await provider.is_available():
-            provider.config.enabled = True
+            self.set_provider_enabled(provider, True)
             logger.info(f"Re-enabled provider: {provider.config.name}")
     
     def get_stats(self) -> Dict[str, Any]:
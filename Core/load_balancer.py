@@ -59,6 +59,15 @@ class LoadBalancer:
         )
         logger.info(f"Added provider to load balancer: {name}")
     
+    def add_providers(self, providers: Dict[str, BaseLLMProvider], cost_per_token: float = 0.0):
+        """Add several providers to the load balancer in one call"""
+        self.providers.update(providers)
+        self.stats.update(
+            (name, ProviderStats(name=name, cost_per_token=cost_per_token))
+            for name in providers
+        )
+        logger.info(f"Added {len(providers)} providers to load balancer")
+    
     def remove_provider(self, name: str):
         """Remove a provider from the load balancer"""
         if name in self.providers:
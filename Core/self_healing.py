@@ -57,6 +57,11 @@ class SelfHealingSystem:
         self.performance_metrics: List[PerformanceMetric] = []
         self.optimizations: Dict[str, Any] = {}
         
+        # Running counters so status checks don't rescan the lists
+        self._n_errors = 0
+        self._n_resolved = 0
+        self._n_ops = 0
+        
         # Load existing data
         self._load_errors()
         self._load_performance()
@@ -105,6 +110,8 @@ class SelfHealingSystem:
                             resolution_method=error_data.get('resolution_method')
                         )
                         self.errors.append(error)
+                        self._n_errors += 1
+                        self._n_resolved += error.resolved
         except Exception as e:
             logger.error(f"Failed to load errors: {e}")
     
@@ -132,6 +139,7 @@ class SelfHealingSystem:
                             metadata=metric_data['metadata']
                         )
                         self.performance_metrics.append(metric)
+                        self._n_ops += 1
         except Exception as e:
             logger.error(f"Failed to load performance metrics: {e}")
     
@@ -172,6 +180,7 @@ class SelfHealingSystem:
         )
         
         self.errors.append(error_record)
+        self._n_errors += 1
         self._save_errors()
         
         # Try to auto-resolve
@@ -188,6 +197,7 @@ class SelfHealingSystem:
                     try:
                         resolution_method(error_record)
                         error_record.resolved = True
+                        self._n_resolved += 1
                         error_record.resolution_method = pattern_info["resolution"]
                         self._save_errors()
                         logger.info(f"Auto-resolved error using {pattern_info['resolution']}")
@@ -238,6 +248,7 @@ class SelfHealingSystem:
         )
         
         self.performance_metrics.append(metric)
+        self._n_ops += 1
         self._save_performance()
         
         # Check for performance issues
@@ -285,6 +296,21 @@ class SelfHealingSystem:
         
         logger.info(f"Suggested optimization for {operation}: {issue_type}")
     
+    @property
+    def error_count(self) -> int:
+        """Number of recorded errors currently retained"""
+        return self._n_errors
+    
+    @property
+    def resolution_rate(self) -> float:
+        """Fraction of retained errors that were auto-resolved"""
+        return self._n_resolved / self._n_errors if self._n_errors else 0
+    
+    @property
+    def operation_count(self) -> int:
+        """Number of performance metrics currently retained"""
+        return self._n_ops
+    
     def get_error_summary(self, days: int = 7) -> Dict[str, Any]:
         """Get summary of recent errors"""
         cutoff = datetime.now() - timedelta(days=days)
@@ -348,10 +374,13 @@ class SelfHealingSystem:
         
         # Clean up old errors
         self.errors = [e for e in self.errors if e.timestamp > cutoff]
+        self._n_errors = len(self.errors)
+        self._n_resolved = sum(1 for e in self.errors if e.resolved)
         self._save_errors()
         
         # Clean up old performance metrics
         self.performance_metrics = [m for m in self.performance_metrics if m.timestamp > cutoff]
+        self._n_ops = len(self.performance_metrics)
         self._save_performance()
         
         logger.info("Cleaned up old self-healing data")
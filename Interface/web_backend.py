@@ -415,19 +415,23 @@ async def get_providers():
         raise HTTPException(status_code=500, detail=str(e))
 
 # Main function
-def main():
-    """Run the web backend server"""
+async def serve(host: str = "0.0.0.0", port: int = 8000):
+    """Run the web backend server on the current event loop"""
     if not FASTAPI_AVAILABLE:
         print("FastAPI not available. Install with: pip install fastapi uvicorn")
         return
     
-    import uvicorn
-    uvicorn.run(
+    config = uvicorn.Config(
         app,
-        host="0.0.0.0",
-        port=8000,
+        host=host,
+        port=port,
         log_level="info"
     )
+    await uvicorn.Server(config).serve()
+
+def main(host: str = "0.0.0.0", port: int = 8000):
+    """Run the web backend server"""
+    asyncio.run(serve(host=host, port=port))
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -1,12 +1,25 @@
 # SwiftAgent Toolkit - Providers Module
 # This file makes the Providers directory a Python package
 
-from .ollama_provider import OllamaProvider
-from .huggingface_provider import HuggingFaceProvider
-from .groq_provider import GroqProvider
-
-__all__ = [
-    'OllamaProvider',
-    'HuggingFaceProvider', 
-    'GroqProvider'
-] 
\ No newline at end of file
+import importlib
+
+# Re-exports are resolved lazily (PEP 562), so importing one provider does not
+# import its siblings, and one with missing dependencies only fails when used
+_LAZY_EXPORTS = {
+    'OllamaProvider': 'ollama_provider',
+    'HuggingFaceProvider': 'huggingface_provider',
+    'GroqProvider': 'groq_provider',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
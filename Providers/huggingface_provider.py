@@ -11,7 +11,7 @@ from typing import Dict, List, Optional, AsyncGenerator, Any
 import aiohttp
 import os
 
-from ..Core.llm_manager import BaseLLMProvider, LLMRequest, LLMResponse, LLMProvider
+from Core.llm_manager import BaseLLMProvider, LLMRequest, LLMResponse, LLMProvider
 
 logger = logging.getLogger(__name__)
 
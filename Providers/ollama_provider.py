@@ -10,7 +10,7 @@ import logging
 from typing import Dict, List, Optional, AsyncGenerator, Any
 import aiohttp
 
-from ..Core.llm_manager import BaseLLMProvider, LLMRequest, LLMResponse, LLMProvider
+from Core.llm_manager import BaseLLMProvider, LLMRequest, LLMResponse, LLMProvider
 
 logger = logging.getLogger(__name__)
 
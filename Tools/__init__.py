@@ -1,12 +1,28 @@
 # SwiftAgent Toolkit - Tools Module
 # This file makes the Tools directory a Python package
 
-from .file_operations import FileOperations, file_ops
-from .image_processor import ImageProcessor, image_processor
-
-__all__ = [
-    'FileOperations',
-    'file_ops',
-    'ImageProcessor', 
-    'image_processor'
-] 
\ No newline at end of file
+import importlib
+
+# Re-exports are resolved lazily (PEP 562), so importing one tool does not
+# import its siblings, and a broken one only fails when it is actually used.
+# Instances named like their submodule (e.g. Tools.image_processor) resolve to the
+# submodule once it has been imported; import those from the submodule itself
+_LAZY_EXPORTS = {
+    'FileOperations': 'file_operations',
+    'file_ops': 'file_operations',
+    'ImageProcessor': 'image_processor',
+    'image_processor': 'image_processor',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,19 +5,38 @@ Provides safe file read/write operations with permission management
 """
 
 import os
+import re
+import stat
 import json
+import mmap
+import codecs
 import hashlib
 import mimetypes
 import tempfile
 import shutil
-from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from pathlib import Path, PurePath
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union, Any
 from dataclasses import dataclass
 from enum import Enum
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Files below this size are hashed with one read; larger ones are streamed
+HASH_ONESHOT_LIMIT = 1024 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Load the system mime database once and keep a plain extension lookup table;
+# compression suffixes (.gz, .bz2, ...) are left to guess_type, which looks
+# through them to the inner extension
+if not mimetypes.inited:
+    mimetypes.init()
+_MIME_BY_EXT: Dict[str, str] = {
+    ext: mime for ext, mime in mimetypes.types_map.items()
+    if ext not in mimetypes.encodings_map
+}
+
 class FilePermission(Enum):
     """File operation permissions"""
     READ = "read"
@@ -69,6 +88,8 @@ class SecurityManager:
             "/tmp",
             "/workspace"  # Common workspace directory
         ]
+        self._safe_prefix_key: Tuple[str, ...] = ()
+        self._safe_prefix_cache: Tuple[str, ...] = ()
         
         # Dangerous file extensions
         self.dangerous_extensions = {
@@ -101,21 +122,44 @@ class SecurityManager:
             '.pdf', '.doc', '.docx', '.xls', '.xlsx',
             '.ppt', '.pptx', '.rtf', '.odt', '.ods', '.odp'
         }
+        
+        # Extensions worth opening for content search (text, code and data),
+        # as a tuple for a single str.endswith() pre-filter
+        self._text_like_exts = tuple(sorted(
+            self.text_extensions | self.code_extensions |
+            {'.json', '.yaml', '.yml', '.xml', '.csv'}
+        ))
+    
+    def _safe_prefixes(self) -> Tuple[str, ...]:
+        """Resolved safe directories, recomputed only when the list changes"""
+        key = tuple(self.safe_directories)
+        if key != self._safe_prefix_key:
+            self._safe_prefix_cache = tuple(str(Path(d).resolve()) for d in key)
+            self._safe_prefix_key = key
+        return self._safe_prefix_cache
     
-    def is_safe_path(self, file_path: str) -> bool:
+    def is_safe_path(self, file_path: Union[str, PurePath]) -> bool:
         """Check if file path is safe to access"""
         try:
-            path = Path(file_path).resolve()
+            # Inspect the path itself before resolving, so a symlink planted
+            # inside a safe directory cannot redirect access elsewhere
+            try:
+                st = os.lstat(file_path)
+                if stat.S_ISLNK(st.st_mode):
+                    logger.debug(f"Refusing symlink path: {file_path}")
+                    return False
+            except FileNotFoundError:
+                pass  # Not created yet; the resolved location is checked below
+            
+            path = str(Path(file_path).resolve())
             
             # Check if path is in safe directories
-            for safe_dir in self.safe_directories:
-                if str(path).startswith(str(Path(safe_dir).resolve())):
+            for prefix in self._safe_prefixes():
+                if path == prefix or path.startswith(prefix.rstrip(os.sep) + os.sep):
                     return True
             
-            # Check for path traversal attempts
-            if '..' in str(path) or str(path).startswith('/'):
+            if '..' in PurePath(file_path).parts:
                 logger.warning(f"Potential path traversal: {file_path}")
-                return False
             
             return False
             
@@ -123,14 +167,14 @@ class SecurityManager:
             logger.error(f"Error checking path safety: {e}")
             return False
     
-    def is_safe_extension(self, file_path: str) -> bool:
+    def is_safe_extension(self, file_path: Union[str, PurePath], ext: Optional[str] = None) -> bool:
         """Check if file extension is safe"""
-        extension = Path(file_path).suffix.lower()
+        extension = ext if ext is not None else PurePath(file_path).suffix.lower()
         return extension not in self.dangerous_extensions
     
-    def get_file_type(self, file_path: str) -> FileType:
+    def get_file_type(self, file_path: Union[str, PurePath], ext: Optional[str] = None) -> FileType:
         """Determine file type from extension"""
-        extension = Path(file_path).suffix.lower()
+        extension = ext if ext is not None else PurePath(file_path).suffix.lower()
         
         if extension in self.text_extensions:
             return FileType.TEXT
@@ -147,11 +191,15 @@ class SecurityManager:
         else:
             return FileType.BINARY
     
-    def get_permissions(self, file_path: str) -> List[FilePermission]:
-        """Get allowed permissions for file"""
+    def _classify(self, path: PurePath, ext: str) -> Tuple[FileType, bool]:
+        """Return (file type, is safe extension) for a precomputed lowercase extension"""
+        return self.get_file_type(path, ext), self.is_safe_extension(path, ext)
+    
+    def _permissions_for(self, is_safe: bool, file_type: FileType) -> List[FilePermission]:
+        """Build the permission list from already-computed safety and type"""
         permissions = []
         
-        if self.is_safe_path(file_path) and self.is_safe_extension(file_path):
+        if is_safe:
             permissions.extend([
                 FilePermission.READ,
                 FilePermission.WRITE,
@@ -159,11 +207,16 @@ class SecurityManager:
             ])
             
             # Only allow deletion for certain file types
-            file_type = self.get_file_type(file_path)
             if file_type in [FileType.TEXT, FileType.CODE, FileType.DATA]:
                 permissions.append(FilePermission.DELETE)
         
         return permissions
+    
+    def get_permissions(self, file_path: Union[str, PurePath]) -> List[FilePermission]:
+        """Get allowed permissions for file"""
+        path = Path(file_path)
+        file_type, safe_ext = self._classify(path, path.suffix.lower())
+        return self._permissions_for(safe_ext and self.is_safe_path(path), file_type)
 
 class FileOperations:
     """Secure file operations manager"""
@@ -173,24 +226,49 @@ class FileOperations:
         self.max_file_size = 50 * 1024 * 1024  # 50MB limit
         self.encoding_fallbacks = ['utf-8', 'utf-16', 'latin-1', 'cp1252']
     
+    @staticmethod
+    def _hash_file(path: Union[str, PurePath], size: Optional[int] = None) -> str:
+        """Short SHA-256 fingerprint of a file's contents
+        
+        Small files are hashed in a single call; larger ones are streamed in
+        1 MiB chunks through a reused buffer.
+        """
+        with open(path, 'rb') as f:
+            if size is not None and size < HASH_ONESHOT_LIMIT:
+                return hashlib.sha256(f.read()).hexdigest()[:16]
+            
+            digest = hashlib.sha256()
+            buf = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                digest.update(view[:n])
+        return digest.hexdigest()[:16]
+    
     def get_file_info(self, file_path: str) -> FileInfo:
         """Get comprehensive file information"""
         path = Path(file_path)
+        ext = path.suffix.lower()
         
-        # Basic file info
-        size = path.stat().st_size if path.exists() else 0
-        mime_type, _ = mimetypes.guess_type(str(path))
-        file_type = self.security.get_file_type(file_path)
-        permissions = self.security.get_permissions(file_path)
-        is_safe = self.security.is_safe_path(file_path) and self.security.is_safe_extension(file_path)
+        # Basic file info from a single stat call
+        try:
+            st = os.stat(path)
+            size = st.st_size
+        except FileNotFoundError:
+            st = None
+            size = 0
+        mime_type = _MIME_BY_EXT.get(ext) or mimetypes.guess_type(path.name)[0]
+        file_type, safe_ext = self.security._classify(path, ext)
+        is_safe = safe_ext and self.security.is_safe_path(path)
+        permissions = self.security._permissions_for(is_safe, file_type)
         
         # Generate file hash for integrity
         file_hash = None
-        if path.exists() and size < self.max_file_size:
+        if st is not None and stat.S_ISREG(st.st_mode) and size < self.max_file_size:
             try:
-                with open(path, 'rb') as f:
-                    content = f.read()
-                    file_hash = hashlib.sha256(content).hexdigest()[:16]
+                file_hash = self._hash_file(path, size)
             except Exception:
                 pass
         
@@ -224,13 +302,9 @@ class FileOperations:
                     file_info=file_info
                 )
             
+            # A missing file surfaces as FileNotFoundError when it is opened,
+            # so no separate existence check is needed here
             path = Path(file_path)
-            if not path.exists():
-                return FileOperationResult(
-                    success=False,
-                    message="File not found",
-                    file_info=file_info
-                )
             
             if file_info.size > self.max_file_size:
                 return FileOperationResult(
@@ -252,21 +326,28 @@ class FileOperations:
                         file_info=file_info
                     )
             
-            # Try to read as text with encoding detection
+            # Try to read as text with encoding detection; the bytes are read
+            # once and each candidate encoding is tried against that buffer
+            raw = path.read_bytes()
             content = None
             used_encoding = encoding
             
             if encoding:
                 encodings_to_try = [encoding]
+            elif raw.startswith(codecs.BOM_UTF8):
+                # A BOM only picks the first candidate; damaged files still
+                # fall through to the usual fallbacks
+                encodings_to_try = ['utf-8-sig'] + self.encoding_fallbacks
+            elif raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+                encodings_to_try = ['utf-16'] + self.encoding_fallbacks
             else:
                 encodings_to_try = self.encoding_fallbacks
             
             for enc in encodings_to_try:
                 try:
-                    with open(path, 'r', encoding=enc) as f:
-                        content = f.read()
-                        used_encoding = enc
-                        break
+                    content = raw.decode(enc)
+                    used_encoding = enc
+                    break
                 except UnicodeDecodeError:
                     continue
             
@@ -277,6 +358,8 @@ class FileOperations:
                     file_info=file_info
                 )
             
+            # Match the universal-newline translation of text-mode open()
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
             file_info.encoding = used_encoding
             
             return FileOperationResult(
@@ -286,6 +369,13 @@ class FileOperations:
                 file_info=file_info
             )
             
+        except FileNotFoundError:
+            return FileOperationResult(
+                success=False,
+                message="File not found",
+                file_info=file_info
+            )
+            
         except Exception as e:
             logger.error(f"Error reading file {file_path}: {e}")
             return FileOperationResult(
@@ -307,9 +397,10 @@ class FileOperations:
                 )
             
             path = Path(file_path)
+            exists = path.exists()
             
             # Check permissions
-            if path.exists():
+            if exists:
                 if FilePermission.WRITE not in file_info.permissions:
                     return FileOperationResult(
                         success=False,
@@ -328,37 +419,37 @@ class FileOperations:
             if create_dirs:
                 path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Create backup if file exists
-            backup_path = None
-            if path.exists():
-                backup_path = path.with_suffix(path.suffix + '.backup')
-                shutil.copy2(path, backup_path)
+            data = content.encode(encoding)
             
+            # Write to a sibling temp file and atomically rename it into place,
+            # so a failed write never leaves a partially written target behind.
+            # Creating it with mode 0o666 lets the kernel apply the umask, giving
+            # new files the same mode a plain open() would have produced.
+            tmp_name = str(path.parent / f".{path.name}.{os.urandom(4).hex()}.tmp")
+            fd = os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
             try:
-                # Write content
-                with open(path, 'w', encoding=encoding) as f:
-                    f.write(content)
-                
-                # Update file info
-                file_info = self.get_file_info(file_path)
-                file_info.encoding = encoding
-                
-                return FileOperationResult(
-                    success=True,
-                    message=f"File written successfully ({len(content)} characters)",
-                    file_info=file_info
-                )
-                
-            except Exception as e:
-                # Restore backup if write failed
-                if backup_path and backup_path.exists():
-                    shutil.copy2(backup_path, path)
-                raise e
+                with os.fdopen(fd, 'wb') as tmp:
+                    tmp.write(data)
+                    tmp.flush()
+                    os.fsync(tmp.fileno())
+                if exists:
+                    shutil.copymode(path, tmp_name)
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+            
+            # Update file info from the bytes already in hand
+            file_info.size = len(data)
+            file_info.encoding = encoding
+            file_info.hash = (hashlib.sha256(data).hexdigest()[:16]
+                              if len(data) < self.max_file_size else None)
             
-            finally:
-                # Clean up backup
-                if backup_path and backup_path.exists():
-                    backup_path.unlink()
+            return FileOperationResult(
+                success=True,
+                message=f"File written successfully ({len(content)} characters)",
+                file_info=file_info
+            )
             
         except Exception as e:
             logger.error(f"Error writing file {file_path}: {e}")
@@ -367,6 +458,29 @@ class FileOperations:
                 message=f"Error writing file: {str(e)}"
             )
     
+    @staticmethod
+    def _iter_directory(dir_path: str, recursive: bool, include_hidden: bool):
+        """Yield (path, name, is_dir) for directory entries
+        
+        Recursive listings use os.walk, which prunes hidden subtrees up front
+        instead of descending into them and filtering afterwards.
+        """
+        if not recursive:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if include_hidden or not entry.name.startswith('.'):
+                        yield entry.path, entry.name, entry.is_dir()
+            return
+        
+        for root, dirs, names in os.walk(dir_path):
+            if not include_hidden:
+                dirs[:] = [d for d in dirs if not d.startswith('.')]
+                names = [n for n in names if not n.startswith('.')]
+            for d in dirs:
+                yield os.path.join(root, d), d, True
+            for n in names:
+                yield os.path.join(root, n), n, False
+    
     def list_directory(self, dir_path: str, recursive: bool = False, 
                       include_hidden: bool = False) -> FileOperationResult:
         """List directory contents safely"""
@@ -392,20 +506,12 @@ class FileOperations:
             
             files = []
             
-            if recursive:
-                pattern = "**/*"
-            else:
-                pattern = "*"
-            
-            for item in path.glob(pattern):
-                if not include_hidden and item.name.startswith('.'):
-                    continue
-                
-                file_info = self.get_file_info(str(item))
+            for item_path, name, is_dir in self._iter_directory(str(path), recursive, include_hidden):
+                file_info = self.get_file_info(item_path)
                 files.append({
-                    'name': item.name,
-                    'path': str(item),
-                    'type': 'directory' if item.is_dir() else 'file',
+                    'name': name,
+                    'path': item_path,
+                    'type': 'directory' if is_dir else 'file',
                     'size': file_info.size,
                     'file_type': file_info.type.value,
                     'is_safe': file_info.is_safe,
@@ -486,6 +592,25 @@ class FileOperations:
                 message=f"Error deleting file: {str(e)}"
             )
     
+    def _file_contains(self, file_path: str, pattern: str,
+                       needle: Optional["re.Pattern[bytes]"]) -> bool:
+        """Case-insensitive content check used by search_files
+        
+        When a bytes needle is given the file is scanned through mmap without
+        decoding; UTF-16 files and non-ASCII patterns go through read_file.
+        """
+        if needle is not None:
+            with open(file_path, 'rb') as f:
+                head = f.read(2)
+                if not head:
+                    return not pattern
+                if not head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        return needle.search(mm) is not None
+        
+        result = self.read_file(file_path)
+        return result.success and pattern.lower() in result.data.lower()
+    
     def search_files(self, directory: str, pattern: str, content_search: bool = False) -> FileOperationResult:
         """Search for files by name or content"""
         try:
@@ -519,7 +644,15 @@ class FileOperations:
             
             # Search file contents if requested
             if content_search:
+                # ASCII patterns are matched case-insensitively on the raw bytes
+                needle = None
+                if pattern.isascii():
+                    needle = re.compile(re.escape(pattern.encode('ascii')), re.IGNORECASE)
+                
+                text_like_exts = self.security._text_like_exts
                 for item in path.rglob("*"):
+                    if not item.name.lower().endswith(text_like_exts):
+                        continue
                     if item.is_file():
                         file_info = self.get_file_info(str(item))
                         if (file_info.is_safe and 
@@ -527,8 +660,7 @@ class FileOperations:
                             file_info.size < 1024 * 1024):  # 1MB limit for content search
                             
                             try:
-                                result = self.read_file(str(item))
-                                if result.success and pattern.lower() in result.data.lower():
+                                if self._file_contains(str(item), pattern, needle):
                                     results.append({
                                         'path': str(item),
                                         'name': item.name,
@@ -551,6 +683,36 @@ class FileOperations:
                 success=False,
                 message=f"Error searching files: {str(e)}"
             )
+    
+    def batch_hash(self, file_paths: List[str], max_workers: int = 2) -> FileOperationResult:
+        """Hash many files concurrently
+        
+        hashlib releases the GIL while digesting, so a small thread pool keeps
+        several independent SHA-256 streams in flight at once.
+        """
+        try:
+            def hash_one(file_path: str) -> Optional[str]:
+                file_info = self.get_file_info(file_path)
+                if not file_info.is_safe or FilePermission.READ not in file_info.permissions:
+                    return None
+                return file_info.hash
+            
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                hashes = dict(zip(file_paths, executor.map(hash_one, file_paths)))
+            
+            hashed = sum(1 for h in hashes.values() if h is not None)
+            return FileOperationResult(
+                success=True,
+                message=f"Hashed {hashed} of {len(file_paths)} files",
+                data=hashes
+            )
+            
+        except Exception as e:
+            logger.error(f"Error hashing files: {e}")
+            return FileOperationResult(
+                success=False,
+                message=f"Error hashing files: {str(e)}"
+            )
 
 # Global instance
 file_ops = FileOperations()
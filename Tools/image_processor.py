@@ -6,20 +6,28 @@ Provides image reading, analysis, and text extraction capabilities
 
 import os
 import io
+import re
 import base64
+import copy
+import hashlib
 import json
 import logging
+import functools
+import threading
+import multiprocessing
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any, Tuple
+from typing import Dict, FrozenSet, List, Optional, Union, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 logger = logging.getLogger(__name__)
 
 # Optional imports with fallbacks
 try:
-    from PIL import Image, ImageEnhance, ImageFilter
+    from PIL import Image, ImageFilter, ImageStat
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
@@ -27,18 +35,54 @@ except ImportError:
 
 try:
     import cv2
-    import numpy as np
     OPENCV_AVAILABLE = True
 except ImportError:
     OPENCV_AVAILABLE = False
     logger.warning("OpenCV not available. Install with: pip install opencv-python")
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional libvips bindings for fast thumbnailing; importing also fails with
+# OSError when the libvips shared library itself is missing
+try:
+    import pyvips
+    VIPS_AVAILABLE = True
+except (ImportError, OSError):
+    VIPS_AVAILABLE = False
+
+# Optional fast non-cryptographic hash for cache keys
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Optional SIMD-accelerated base64 encoder
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
+# tesserocr keeps one Tesseract engine loaded in-process; pytesseract spawns
+# the tesseract binary for every call
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
 try:
     import pytesseract
     TESSERACT_AVAILABLE = True
 except ImportError:
-    TESSERACT_AVAILABLE = False
-    logger.warning("Tesseract not available. Install with: pip install pytesseract")
+    TESSERACT_AVAILABLE = TESSEROCR_AVAILABLE
+    if not TESSEROCR_AVAILABLE:
+        logger.warning("Tesseract not available. Install with: pip install pytesseract")
 
 class ImageFormat(Enum):
     """Supported image formats"""
@@ -59,6 +103,21 @@ class AnalysisType(Enum):
     COLOR_ANALYSIS = "color_analysis"
     QUALITY_ASSESSMENT = "quality_assessment"
 
+# Pillow format name -> ImageFormat
+_FORMAT_MAP: Dict[str, ImageFormat] = {
+    'JPEG': ImageFormat.JPEG,
+    'PNG': ImageFormat.PNG,
+    'GIF': ImageFormat.GIF,
+    'BMP': ImageFormat.BMP,
+    'WEBP': ImageFormat.WEBP,
+    'TIFF': ImageFormat.TIFF
+}
+
+# File extensions treated as images
+_SUPPORTED_EXT: FrozenSet[str] = frozenset({
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff', '.tif', '.svg'
+})
+
 @dataclass
 class ImageInfo:
     """Image information structure"""
@@ -105,13 +164,74 @@ class ImageAnalysisResult:
     quality_score: Optional[float] = None
     metadata: Optional[Dict[str, Any]] = None
 
+def _replace_image(old: "Image.Image", new: "Image.Image",
+                   keep: Optional["Image.Image"] = None) -> "Image.Image":
+    """Return new, releasing old's pixel buffer unless it is the caller-owned keep"""
+    if old is not new and old is not keep:
+        old.close()
+    return new
+
+def _file_key(image_path: str) -> Tuple[str, int, int]:
+    """Cache key identifying a file version: (path, mtime_ns, size)"""
+    try:
+        st = os.stat(image_path)
+    except FileNotFoundError:
+        raise Exception("Image file not found")
+    return str(image_path), st.st_mtime_ns, st.st_size
+
+@functools.lru_cache(maxsize=256)
+def _load_downsampled(image_path: str, mtime_ns: int, size: int, max_dim: int) -> "np.ndarray":
+    """Decode an image to a read-only RGB array no larger than max_dim
+    
+    Keyed on mtime and size as well as the path, so an edited file is
+    decoded again rather than served stale.
+    """
+    with Image.open(image_path) as img:
+        # Decode JPEGs at reduced scale (must precede any pixel access)
+        if img.format == 'JPEG':
+            img.draft('RGB', (max_dim, max_dim))
+        
+        rgb = img.convert('RGB') if img.mode != 'RGB' else img
+        try:
+            rgb.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS)
+            arr = np.asarray(rgb, dtype=np.uint8)
+        finally:
+            rgb.close()
+    
+    arr.setflags(write=False)
+    return arr
+
 class ImageProcessor:
     """Main image processing class"""
     
+    # Word tokenizer and common English words for _detect_language
+    _TOKEN_RE = re.compile(r'[a-z]+')
+    _ENGLISH_STOPWORDS = frozenset({
+        'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'
+    })
+    
     def __init__(self):
         self.max_image_size = 20 * 1024 * 1024  # 20MB limit
         self.max_dimensions = (4096, 4096)
-        self.supported_formats = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff', '.tif', '.svg'}
+        self.supported_formats = _SUPPORTED_EXT
+        
+        # OCR settings: downscale taller images, treat the page as one
+        # uniform text block and use the LSTM engine only
+        self.ocr_max_height = 1600
+        self.ocr_config = '--psm 6 --oem 1'
+        
+        # On-disk cache of base64-encoded images for vision-model requests
+        self._b64_cache_dir = Path(tempfile.gettempdir()) / "swiftagent_imgcache"
+        self._b64_cache_max_files = 512
+        
+        # Persistent tesserocr engine (created on first OCR call)
+        self._tess_api = None
+        self._tess_lock = threading.Lock()
+        
+        # Analysis results keyed by file version and requested analysis types
+        self._result_cache: Dict[Tuple, ImageAnalysisResult] = {}
+        self._result_cache_size = 256
+        self._result_cache_lock = threading.Lock()
         
         # Check available capabilities
         self.capabilities = {
@@ -123,108 +243,205 @@ class ImageProcessor:
     
     def is_image_file(self, file_path: str) -> bool:
         """Check if file is a supported image format"""
-        extension = Path(file_path).suffix.lower()
-        return extension in self.supported_formats
+        return os.path.splitext(file_path)[1].lower() in _SUPPORTED_EXT
     
     def get_image_info(self, image_path: str) -> ImageInfo:
         """Extract basic image information"""
         if not PIL_AVAILABLE:
             raise Exception("PIL/Pillow required for image processing")
         
-        path = Path(image_path)
-        if not path.exists():
+        try:
+            st = os.stat(image_path)
+        except FileNotFoundError:
             raise Exception("Image file not found")
         
         try:
-            with Image.open(path) as img:
-                # Determine format
-                format_map = {
-                    'JPEG': ImageFormat.JPEG,
-                    'PNG': ImageFormat.PNG,
-                    'GIF': ImageFormat.GIF,
-                    'BMP': ImageFormat.BMP,
-                    'WEBP': ImageFormat.WEBP,
-                    'TIFF': ImageFormat.TIFF
-                }
-                img_format = format_map.get(img.format, ImageFormat.JPEG)
-                
-                # Basic properties
-                width, height = img.size
-                size_bytes = path.stat().st_size
-                color_mode = img.mode
-                has_transparency = 'transparency' in img.info or color_mode in ('RGBA', 'LA')
-                
-                # Animation info for GIFs
-                is_animated = hasattr(img, 'is_animated') and img.is_animated
-                frames = getattr(img, 'n_frames', 1) if is_animated else 1
-                
-                # DPI info
-                dpi = img.info.get('dpi', None)
-                
-                return ImageInfo(
-                    path=str(path),
-                    format=img_format,
-                    width=width,
-                    height=height,
-                    size_bytes=size_bytes,
-                    color_mode=color_mode,
-                    has_transparency=has_transparency,
-                    is_animated=is_animated,
-                    frames=frames,
-                    dpi=dpi
-                )
+            with Image.open(image_path) as img:
+                return self._build_image_info(img, str(image_path), st.st_size)
                 
         except Exception as e:
             raise Exception(f"Error reading image: {str(e)}")
     
+    def _build_image_info(self, img: "Image.Image", path: str, size_bytes: int) -> ImageInfo:
+        """Build ImageInfo from an opened (not necessarily loaded) image"""
+        # Determine format
+        img_format = _FORMAT_MAP.get(img.format, ImageFormat.JPEG)
+        
+        # Basic properties
+        width, height = img.size
+        color_mode = img.mode
+        has_transparency = 'transparency' in img.info or color_mode in ('RGBA', 'LA')
+        
+        # Animation info for GIFs
+        is_animated = hasattr(img, 'is_animated') and img.is_animated
+        frames = getattr(img, 'n_frames', 1) if is_animated else 1
+        
+        # DPI info
+        dpi = img.info.get('dpi', None)
+        
+        return ImageInfo(
+            path=path,
+            format=img_format,
+            width=width,
+            height=height,
+            size_bytes=size_bytes,
+            color_mode=color_mode,
+            has_transparency=has_transparency,
+            is_animated=is_animated,
+            frames=frames,
+            dpi=dpi
+        )
+    
     def encode_image_base64(self, image_path: str, max_size: Optional[Tuple[int, int]] = None) -> str:
-        """Encode image as base64 for LLM vision models"""
+        """Encode image as base64 for LLM vision models
+        
+        Encoded results are cached on disk, keyed by a fast content hash of
+        the file plus its mtime, size and max_size, so repeated requests for
+        the same image skip decode, resize and encoding.
+        """
         if not PIL_AVAILABLE:
             raise Exception("PIL/Pillow required for image encoding")
         
+        cache_file = self._b64_cache_file(image_path, max_size)
+        if cache_file is not None:
+            try:
+                encoded = cache_file.read_text(encoding='ascii')
+                os.utime(cache_file)  # Mark as recently used
+                return encoded
+            except OSError:
+                pass
+        
+        encoded = self._encode_image_base64(image_path, max_size)
+        
+        if cache_file is not None:
+            self._store_b64_cache(cache_file, encoded)
+        return encoded
+    
+    def _b64_cache_file(self, image_path: str, max_size: Optional[Tuple[int, int]]) -> Optional[Path]:
+        """Cache location for an encoded image, or None if caching is unavailable"""
+        try:
+            st = os.stat(image_path)
+            with open(image_path, 'rb') as f:
+                head = f.read(1 << 20)  # First 1 MiB; mtime and size cover the rest
+            
+            hasher = xxhash.xxh128() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=16)
+            hasher.update(head)
+            hasher.update(f"{st.st_mtime_ns}:{st.st_size}".encode())
+            
+            self._b64_cache_dir.mkdir(mode=0o700, exist_ok=True)
+            # Only trust a cache directory this user owns
+            if hasattr(os, 'getuid') and self._b64_cache_dir.stat().st_uid != os.getuid():
+                return None
+        except OSError:
+            return None
+        
+        size_tag = f"{max_size[0]}x{max_size[1]}" if max_size else "full"
+        return self._b64_cache_dir / f"{hasher.hexdigest()}_{size_tag}.b64"
+    
+    def _store_b64_cache(self, cache_file: Path, encoded: str):
+        """Atomically write a cache entry and evict the least recently used ones"""
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=str(self._b64_cache_dir), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='ascii') as f:
+                    f.write(encoded)
+                os.replace(tmp_name, cache_file)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+            
+            entries = [e for e in os.scandir(self._b64_cache_dir) if e.name.endswith('.b64')]
+            if len(entries) > self._b64_cache_max_files:
+                entries.sort(key=lambda e: e.stat().st_mtime)
+                for entry in entries[:len(entries) - self._b64_cache_max_files]:
+                    os.unlink(entry.path)
+        except OSError as e:
+            logger.debug(f"Could not update image cache: {e}")
+    
+    def _encode_image_base64(self, image_path: str, max_size: Optional[Tuple[int, int]]) -> str:
+        """Decode, resize and base64-encode an image as JPEG"""
         try:
             with Image.open(image_path) as img:
-                # Convert to RGB if necessary
-                if img.mode in ('RGBA', 'P'):
-                    img = img.convert('RGB')
+                # Let libjpeg decode at a reduced scale; draft() only has an
+                # effect before the pixel data is loaded
+                if max_size and img.format == 'JPEG':
+                    img.draft('RGB', max_size)
                 
-                # Resize if needed
-                if max_size:
-                    img.thumbnail(max_size, Image.Resampling.LANCZOS)
-                
-                # Save to bytes
-                buffer = io.BytesIO()
-                img.save(buffer, format='JPEG', quality=85, optimize=True)
-                img_bytes = buffer.getvalue()
+                # Convert to RGB if necessary
+                rgb = img.convert('RGB') if img.mode in ('RGBA', 'P') else img
+                try:
+                    # Resize if needed
+                    if max_size:
+                        rgb.thumbnail(max_size, Image.Resampling.LANCZOS)
+                    
+                    # Save to bytes
+                    buffer = io.BytesIO()
+                    rgb.save(buffer, format='JPEG', quality=85, optimize=True)
+                finally:
+                    rgb.close()
                 
-                # Encode as base64
-                return base64.b64encode(img_bytes).decode('utf-8')
+                # Encode as base64 straight from the buffer (getbuffer() is a
+                # zero-copy view, unlike getvalue())
+                with buffer.getbuffer() as img_bytes:
+                    if PYBASE64_AVAILABLE:
+                        return pybase64.b64encode_as_string(img_bytes)
+                    return base64.b64encode(img_bytes).decode('ascii')
                 
         except Exception as e:
             raise Exception(f"Error encoding image: {str(e)}")
     
-    def extract_text_tesseract(self, image_path: str) -> TextExtraction:
-        """Extract text using Tesseract OCR"""
+    def extract_text_tesseract(self, image_path: str,
+                               pil_image: Optional["Image.Image"] = None,
+                               preprocess: bool = True,
+                               source_size: Optional[Tuple[int, int]] = None) -> TextExtraction:
+        """Extract text using Tesseract OCR
+        
+        pil_image may carry an already decoded copy of image_path; if it was
+        decoded at reduced size, pass the file's (width, height) as
+        source_size so boxes come back in source coordinates. Set
+        preprocess=False to hand the image to Tesseract unmodified.
+        """
         if not TESSERACT_AVAILABLE:
             raise Exception("Tesseract OCR not available")
         
+        image = None
         try:
-            # Load image
-            image = Image.open(image_path)
-            
-            # Preprocess image for better OCR
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
+            # Load image. Intermediates are closed as soon as they are
+            # replaced, so only one full-size buffer is alive per step
+            image = pil_image if pil_image is not None else Image.open(image_path)
             
-            # Enhance image quality
-            enhancer = ImageEnhance.Contrast(image)
-            image = enhancer.enhance(2.0)
+            # Tesseract's run time scales with pixel count, so very tall images
+            # are scaled down first; boxes are mapped back to source coordinates
+            source_width, source_height = source_size or image.size
+            if image.height > self.ocr_max_height:
+                image = _replace_image(image, image.resize(
+                    (max(1, round(image.width * self.ocr_max_height / image.height)),
+                     self.ocr_max_height),
+                    Image.Resampling.LANCZOS
+                ), pil_image)
+            scale_x = source_width / image.width
+            scale_y = source_height / image.height
             
-            enhancer = ImageEnhance.Sharpness(image)
-            image = enhancer.enhance(2.0)
+            # Preprocess image for better OCR
+            if preprocess:
+                image = _replace_image(image, self._prepare_for_ocr(image), pil_image)
+            elif image.mode != 'RGB':
+                image = _replace_image(image, image.convert('RGB'), pil_image)
             
             # Extract text with detailed info
-            data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
+            osd = None
+            if TESSEROCR_AVAILABLE:
+                # SetImage/Recognize and orientation detection share the engine's
+                # current image, so both run under one lock
+                with self._tess_lock:
+                    data = self._tesserocr_words(image)
+                    try:
+                        osd = self._tesserocr_api().DetectOrientationScript()
+                    except Exception:
+                        osd = None
+            else:
+                data = pytesseract.image_to_data(image, config=self.ocr_config,
+                                                 output_type=pytesseract.Output.DICT)
             
             # Filter out low-confidence text
             text_parts = []
@@ -242,10 +459,10 @@ class ImageProcessor:
                     bounding_boxes.append({
                         'text': text,
                         'confidence': conf,
-                        'x': data['left'][i],
-                        'y': data['top'][i],
-                        'width': data['width'][i],
-                        'height': data['height'][i]
+                        'x': round(data['left'][i] * scale_x),
+                        'y': round(data['top'][i] * scale_y),
+                        'width': round(data['width'][i] * scale_x),
+                        'height': round(data['height'][i] * scale_y)
                     })
             
             # Combine text
@@ -258,8 +475,12 @@ class ImageProcessor:
             # Detect orientation
             orientation = None
             try:
-                osd = pytesseract.image_to_osd(image, output_type=pytesseract.Output.DICT)
-                orientation = osd.get('rotate', 0)
+                if TESSEROCR_AVAILABLE:
+                    if osd:
+                        orientation = (360 - osd['orient_deg']) % 360
+                else:
+                    osd = pytesseract.image_to_osd(image, output_type=pytesseract.Output.DICT)
+                    orientation = osd.get('rotate', 0)
             except:
                 pass
             
@@ -273,96 +494,281 @@ class ImageProcessor:
             
         except Exception as e:
             raise Exception(f"Error extracting text: {str(e)}")
+        
+        finally:
+            if image is not None and image is not pil_image:
+                image.close()
+    
+    def _tesserocr_api(self) -> "tesserocr.PyTessBaseAPI":
+        """Lazily created Tesseract engine, reused across OCR calls"""
+        if self._tess_api is None:
+            # Same engine settings as ocr_config: uniform text block, LSTM only
+            self._tess_api = tesserocr.PyTessBaseAPI(
+                lang='eng', psm=tesserocr.PSM.SINGLE_BLOCK, oem=tesserocr.OEM.LSTM_ONLY)
+        return self._tess_api
     
-    def analyze_colors(self, image_path: str) -> ColorAnalysis:
-        """Analyze image colors and properties"""
+    def _tesserocr_words(self, image: "Image.Image") -> Dict[str, List[Any]]:
+        """Word-level OCR via tesserocr, shaped like pytesseract's Output.DICT"""
+        api = self._tesserocr_api()
+        api.SetImage(image)
+        api.Recognize()
+        
+        data = {'text': [], 'conf': [], 'left': [], 'top': [], 'width': [], 'height': []}
+        iterator = api.GetIterator()
+        if iterator is None:
+            return data
+        
+        level = tesserocr.RIL.WORD
+        for word in tesserocr.iterate_level(iterator, level):
+            box = word.BoundingBox(level)
+            if box is None:
+                continue
+            x1, y1, x2, y2 = box
+            data['text'].append(word.GetUTF8Text(level) or '')
+            data['conf'].append(word.Confidence(level))
+            data['left'].append(x1)
+            data['top'].append(y1)
+            data['width'].append(x2 - x1)
+            data['height'].append(y2 - y1)
+        return data
+    
+    def _prepare_for_ocr(self, image: "Image.Image") -> "Image.Image":
+        """Grayscale and enhance an image for Tesseract
+        
+        Uses CLAHE when OpenCV is available, which copes with uneven
+        lighting; otherwise a 2x contrast lookup table followed by a single
+        unsharp-mask pass.
+        """
+        gray = image.convert('L')
+        
+        if OPENCV_AVAILABLE:
+            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+            equalized = clahe.apply(np.asarray(gray))
+            gray.close()
+            return Image.fromarray(equalized)
+        
+        mean = ImageStat.Stat(gray).mean[0]
+        lut = [min(255, max(0, int(mean + 2.0 * (v - mean) + 0.5))) for v in range(256)]
+        contrasted = _replace_image(gray, gray.point(lut))
+        return _replace_image(contrasted, contrasted.filter(
+            ImageFilter.UnsharpMask(radius=2, percent=100, threshold=0)))
+    
+    def analyze_colors(self, image_path: str,
+                       pil_image: Optional["Image.Image"] = None) -> ColorAnalysis:
+        """Analyze image colors and properties
+        
+        pil_image may carry an already decoded copy of image_path.
+        """
         if not PIL_AVAILABLE:
             raise Exception("PIL/Pillow required for color analysis")
         
         try:
+            if pil_image is not None:
+                # convert() copies, so the shared image is left untouched
+                img = pil_image.convert('RGB')
+                try:
+                    img.thumbnail((200, 200), Image.Resampling.LANCZOS)
+                    if NUMPY_AVAILABLE:
+                        return self._analyze_color_array(np.asarray(img, dtype=np.uint8))
+                    return self._analyze_color_pixels(img)
+                finally:
+                    img.close()
+            
+            if NUMPY_AVAILABLE:
+                arr = _load_downsampled(*_file_key(image_path), 200)
+                return self._analyze_color_array(arr)
+            
             with Image.open(image_path) as img:
-                # Convert to RGB
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Resize for faster processing
-                img.thumbnail((200, 200), Image.Resampling.LANCZOS)
-                
-                # Get color statistics
-                pixels = list(img.getdata())
-                
-                # Calculate dominant colors
-                from collections import Counter
-                color_counts = Counter(pixels)
-                dominant_colors = [color for color, count in color_counts.most_common(5)]
-                
-                # Convert to hex palette
-                color_palette = [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in dominant_colors]
-                
-                # Calculate brightness, contrast, saturation
-                brightness = sum(sum(pixel) for pixel in pixels) / (len(pixels) * 3) / 255
-                
-                # Simple contrast calculation
-                grays = [sum(pixel) / 3 for pixel in pixels]
-                contrast = (max(grays) - min(grays)) / 255 if grays else 0
-                
-                # Saturation calculation
-                saturations = []
-                for r, g, b in pixels:
-                    max_val = max(r, g, b)
-                    min_val = min(r, g, b)
-                    saturation = (max_val - min_val) / max_val if max_val > 0 else 0
-                    saturations.append(saturation)
-                avg_saturation = sum(saturations) / len(saturations)
-                
-                # Temperature (warm vs cool)
-                avg_r = sum(pixel[0] for pixel in pixels) / len(pixels)
-                avg_b = sum(pixel[2] for pixel in pixels) / len(pixels)
-                temperature = "warm" if avg_r > avg_b else "cool"
+                # Decode JPEGs at reduced scale (must precede any pixel access)
+                if img.format == 'JPEG':
+                    img.draft('RGB', (200, 200))
                 
-                return ColorAnalysis(
-                    dominant_colors=dominant_colors,
-                    color_palette=color_palette,
-                    brightness=brightness,
-                    contrast=contrast,
-                    saturation=avg_saturation,
-                    temperature=temperature
-                )
+                # Convert to RGB
+                rgb = img.convert('RGB') if img.mode != 'RGB' else img
+                try:
+                    # Resize for faster processing
+                    rgb.thumbnail((200, 200), Image.Resampling.LANCZOS)
+                    
+                    return self._analyze_color_pixels(rgb)
+                finally:
+                    rgb.close()
                 
         except Exception as e:
             raise Exception(f"Error analyzing colors: {str(e)}")
     
-    def assess_quality(self, image_path: str) -> float:
-        """Assess image quality (0.0 - 1.0)"""
+    def _analyze_color_pixels(self, img: "Image.Image") -> ColorAnalysis:
+        """Color statistics over a small RGB image without NumPy
+        
+        Per-pixel work stays in Pillow's C code: getcolors() for the color
+        histogram, ImageStat for channel means and an HSV conversion for
+        saturation.
+        """
+        # (count, (r, g, b)) for every distinct color; maxcolors covers all pixels
+        colors = img.getcolors(maxcolors=img.width * img.height)
+        
+        # Calculate dominant colors
+        dominant_colors = [color for _, color in sorted(colors, key=lambda c: c[0], reverse=True)[:5]]
+        
+        # Convert to hex palette
+        color_palette = [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in dominant_colors]
+        
+        # Calculate brightness, contrast, saturation
+        avg_r, avg_g, avg_b = ImageStat.Stat(img).mean
+        brightness = (avg_r + avg_g + avg_b) / 3 / 255
+        
+        # Simple contrast calculation
+        grays = [(r + g + b) / 3 for _, (r, g, b) in colors]
+        contrast = (max(grays) - min(grays)) / 255 if grays else 0
+        
+        # Saturation is the S channel of HSV: (max - min) / max per pixel
+        hsv = img.convert('HSV')
+        avg_saturation = ImageStat.Stat(hsv.getchannel('S')).mean[0] / 255
+        hsv.close()
+        
+        # Temperature (warm vs cool)
+        temperature = "warm" if avg_r > avg_b else "cool"
+        
+        return ColorAnalysis(
+            dominant_colors=dominant_colors,
+            color_palette=color_palette,
+            brightness=brightness,
+            contrast=contrast,
+            saturation=avg_saturation,
+            temperature=temperature
+        )
+    
+    @staticmethod
+    def _dominant_colors(flat: "np.ndarray", count: int = 5,
+                         quantize_bits: Optional[int] = 5) -> List[Tuple[int, int, int]]:
+        """Most frequent colors of an (N, 3) uint8 pixel array
+        
+        With quantize_bits set, pixels are bucketed to that many bits per
+        channel (32768 buckets at 5 bits) and each dominant color is the mean
+        of its bucket, so near-identical shades count as one color and the
+        work no longer depends on how many distinct pixels there are. Pass
+        None for exact colors, counted over packed uint32 keys.
+        """
+        if len(flat) == 0:
+            return []
+        
+        if quantize_bits:
+            shift = 8 - quantize_bits
+            q = (flat >> shift).astype(np.uint32)
+            keys = (q[:, 0] << (2 * quantize_bits)) | (q[:, 1] << quantize_bits) | q[:, 2]
+            buckets = 1 << (3 * quantize_bits)
+            counts = np.bincount(keys, minlength=buckets)
+            
+            top_n = min(count, int(np.count_nonzero(counts)))
+            top = np.argpartition(-counts, top_n - 1)[:top_n]
+            top = top[np.argsort(-counts[top], kind='stable')]
+            
+            # Mean color of each selected bucket
+            in_top = np.isin(keys, top)
+            sums = [np.bincount(keys[in_top], weights=flat[in_top, c], minlength=buckets)[top]
+                    for c in range(3)]
+            means = np.rint(np.stack(sums, axis=1) / counts[top][:, None]).astype(int)
+            return [tuple(int(v) for v in color) for color in means]
+        
+        packed = ((flat[:, 0].astype(np.uint32) << 16) |
+                  (flat[:, 1].astype(np.uint32) << 8) |
+                  flat[:, 2].astype(np.uint32))
+        values, counts = np.unique(packed, return_counts=True)
+        
+        top_n = min(count, len(values))
+        top = np.argpartition(-counts, top_n - 1)[:top_n]
+        top = top[np.argsort(-counts[top], kind='stable')]
+        return [(int(k >> 16) & 0xff, int(k >> 8) & 0xff, int(k) & 0xff)
+                for k in values[top]]
+    
+    def _analyze_color_array(self, arr: "np.ndarray") -> ColorAnalysis:
+        """Vectorized color statistics over an RGB uint8 array"""
+        flat = arr.reshape(-1, 3)
+        
+        dominant_colors = self._dominant_colors(flat)
+        
+        # Convert to hex palette
+        color_palette = [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in dominant_colors]
+        
+        # Brightness and contrast both come from one 256-bin gray histogram
+        grays = (flat.sum(axis=1, dtype=np.uint16) + 1) // 3  # rounded channel mean
+        hist = np.bincount(grays, minlength=256)
+        levels = np.nonzero(hist)[0]
+        brightness = float(np.dot(np.arange(256), hist)) / (float(hist.sum()) * 255)
+        contrast = float(levels[-1] - levels[0]) / 255
+        
+        # Saturation calculation
+        max_val = flat.max(axis=1).astype(np.float64)
+        min_val = flat.min(axis=1)
+        saturations = np.divide(max_val - min_val, max_val,
+                                out=np.zeros_like(max_val), where=max_val > 0)
+        avg_saturation = float(saturations.mean())
+        
+        # Temperature (warm vs cool)
+        temperature = "warm" if flat[:, 0].mean() > flat[:, 2].mean() else "cool"
+        
+        return ColorAnalysis(
+            dominant_colors=dominant_colors,
+            color_palette=color_palette,
+            brightness=brightness,
+            contrast=contrast,
+            saturation=avg_saturation,
+            temperature=temperature
+        )
+    
+    def assess_quality(self, image_path: str, ndarray: Optional["np.ndarray"] = None,
+                       image_info: Optional[ImageInfo] = None,
+                       source_size: Optional[Tuple[int, int]] = None) -> float:
+        """Assess image quality (0.0 - 1.0)
+        
+        ndarray may carry already decoded (possibly draft-reduced) RGB pixels
+        of image_path; it is only used when the file's (width, height) is
+        known from source_size or image_info. image_info also feeds the
+        non-OpenCV fallback.
+        """
         if not OPENCV_AVAILABLE:
             # Fallback to basic quality assessment
-            return self._basic_quality_assessment(image_path)
+            return self._basic_quality_assessment(image_path, image_info)
         
         try:
-            # Load image with OpenCV
-            img = cv2.imread(image_path)
-            if img is None:
-                raise Exception("Could not load image")
+            # Blur is measured at a quarter of the source resolution: 16x fewer
+            # pixels through the decoder and the Laplacian, with a matching
+            # normalization. Decoded pixels are only reused when they can be
+            # shrunk to exactly that size; upscaling would smooth away blur
+            if source_size is None and image_info is not None:
+                source_size = (image_info.width, image_info.height)
+            target = None
+            if ndarray is not None and source_size is not None:
+                target = (max(1, round(source_size[0] / 4)), max(1, round(source_size[1] / 4)))
+                if ndarray.shape[1] < target[0] or ndarray.shape[0] < target[1]:
+                    target = None
             
-            # Convert to grayscale
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+            if target is not None:
+                gray = cv2.resize(cv2.cvtColor(ndarray, cv2.COLOR_RGB2GRAY), target,
+                                  interpolation=cv2.INTER_AREA)
+            else:
+                # Let OpenCV decode straight to reduced-size grayscale
+                gray = cv2.imread(image_path, cv2.IMREAD_REDUCED_GRAYSCALE_4)
+                if gray is None:
+                    return self._basic_quality_assessment(image_path, image_info)
             
             # Calculate Laplacian variance (blur detection)
             laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
             
-            # Normalize to 0-1 scale (empirically determined thresholds)
-            quality_score = min(1.0, laplacian_var / 1000.0)
+            # Normalize to 0-1 scale (empirically determined for 1/4 scale)
+            quality_score = min(1.0, laplacian_var / 250.0)
             
             return quality_score
             
         except Exception as e:
             logger.warning(f"OpenCV quality assessment failed: {e}")
-            return self._basic_quality_assessment(image_path)
+            return self._basic_quality_assessment(image_path, image_info)
     
-    def _basic_quality_assessment(self, image_path: str) -> float:
+    def _basic_quality_assessment(self, image_path: str,
+                                  info: Optional[ImageInfo] = None) -> float:
         """Basic quality assessment using PIL"""
         try:
-            info = self.get_image_info(image_path)
+            if info is None:
+                info = self.get_image_info(image_path)
             
             # Simple heuristics
             score = 0.5  # Base score
@@ -396,9 +802,9 @@ class ImageProcessor:
         # Very basic heuristics
         text_lower = text.lower()
         
-        # Check for common English words
-        english_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        english_count = sum(1 for word in english_words if word in text_lower)
+        # Check for common English words (whole words, not substrings)
+        tokens = set(self._TOKEN_RE.findall(text_lower))
+        english_count = len(tokens & self._ENGLISH_STOPWORDS)
         
         if english_count >= 2:
             return 'en'
@@ -441,32 +847,80 @@ class ImageProcessor:
             ]
         
         try:
+            cache_key = (*_file_key(image_path), tuple(sorted(t.value for t in analysis_types)))
+            with self._result_cache_lock:
+                cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                # Callers get their own copy so they can't alter the cached entry
+                return copy.deepcopy(cached)
+            
             result = ImageAnalysisResult(success=True, message="Analysis completed")
             
-            # Basic info (always included)
-            if AnalysisType.BASIC_INFO in analysis_types:
-                result.image_info = self.get_image_info(image_path)
+            wants_text = AnalysisType.TEXT_EXTRACTION in analysis_types and TESSERACT_AVAILABLE
+            wants_color = AnalysisType.COLOR_ANALYSIS in analysis_types
+            wants_quality = AnalysisType.QUALITY_ASSESSMENT in analysis_types
             
-            # Text extraction
-            if AnalysisType.TEXT_EXTRACTION in analysis_types and TESSERACT_AVAILABLE:
-                try:
-                    result.text_extraction = self.extract_text_tesseract(image_path)
-                except Exception as e:
-                    logger.warning(f"Text extraction failed: {e}")
+            # Open the file once and share the decoded pixels with every analyzer
+            pil_image = None
+            ndarray = None
+            source_size = None
+            if PIL_AVAILABLE:
+                with Image.open(image_path) as img:
+                    # Basic info (read from the header, before any decoding)
+                    if AnalysisType.BASIC_INFO in analysis_types:
+                        result.image_info = self._build_image_info(img, cache_key[0], cache_key[2])
+                    
+                    if wants_text or wants_color or wants_quality:
+                        # draft() may shrink the decode; OCR boxes are still
+                        # reported against the full-size source
+                        source_size = img.size
+                        if img.format == 'JPEG' and max(img.size) > 2048:
+                            img.draft('RGB', (2048, 2048))
+                        pil_image = img.convert('RGB')
+                
+                if wants_quality and OPENCV_AVAILABLE:
+                    ndarray = np.asarray(pil_image)
+            elif AnalysisType.BASIC_INFO in analysis_types:
+                result.image_info = self.get_image_info(image_path)
             
-            # Color analysis
-            if AnalysisType.COLOR_ANALYSIS in analysis_types:
-                try:
-                    result.color_analysis = self.analyze_colors(image_path)
-                except Exception as e:
-                    logger.warning(f"Color analysis failed: {e}")
+            # (result field, label, analyzer, arguments) for each requested analysis
+            analyses = []
+            if wants_text:
+                analyses.append(('text_extraction', "Text extraction",
+                                 self.extract_text_tesseract, (image_path, pil_image, True, source_size)))
+            if wants_color:
+                analyses.append(('color_analysis', "Color analysis",
+                                 self.analyze_colors, (image_path, pil_image)))
+            if wants_quality:
+                analyses.append(('quality_score', "Quality assessment",
+                                 self.assess_quality, (image_path, ndarray, result.image_info, source_size)))
             
-            # Quality assessment
-            if AnalysisType.QUALITY_ASSESSMENT in analysis_types:
-                try:
-                    result.quality_score = self.assess_quality(image_path)
-                except Exception as e:
-                    logger.warning(f"Quality assessment failed: {e}")
+            partial = False
+            try:
+                # The analyses are independent and Pillow, OpenCV and Tesseract
+                # release the GIL, so several of them run concurrently
+                if len(analyses) > 1:
+                    with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+                        futures = [executor.submit(func, *args) for _, _, func, args in analyses]
+                        outcomes = [future.exception() or future.result() for future in futures]
+                else:
+                    outcomes = []
+                    for _, _, func, args in analyses:
+                        try:
+                            outcomes.append(func(*args))
+                        except Exception as e:
+                            outcomes.append(e)
+                
+                for (field, label, _, _), outcome in zip(analyses, outcomes):
+                    if isinstance(outcome, Exception):
+                        logger.warning(f"{label} failed: {outcome}")
+                        partial = True
+                    else:
+                        setattr(result, field, outcome)
+            finally:
+                # The shared decoded copy is no longer needed by any analyzer
+                if pil_image is not None:
+                    pil_image.close()
             
             # Add metadata
             result.metadata = {
@@ -478,6 +932,15 @@ class ImageProcessor:
                 'analysis_types': [t.value for t in analysis_types]
             }
             
+            # Results with a failed sub-analysis are not cached, so the next
+            # call retries them
+            if not partial:
+                stored = copy.deepcopy(result)
+                with self._result_cache_lock:
+                    if len(self._result_cache) >= self._result_cache_size:
+                        self._result_cache.pop(next(iter(self._result_cache)), None)
+                    self._result_cache[cache_key] = stored
+            
             return result
             
         except Exception as e:
@@ -487,10 +950,23 @@ class ImageProcessor:
             )
     
     def create_thumbnail(self, image_path: str, output_path: str, size: Tuple[int, int] = (256, 256)) -> bool:
-        """Create thumbnail of image"""
-        if not PIL_AVAILABLE:
+        """Create thumbnail of image (via libvips when pyvips is installed)"""
+        if not PIL_AVAILABLE and not VIPS_AVAILABLE:
             raise Exception("PIL/Pillow required for thumbnail creation")
         
+        if VIPS_AVAILABLE:
+            try:
+                # Shrink-on-load and resize in one streaming libvips operation;
+                # size='down' matches Pillow's thumbnail(), which never enlarges
+                thumb = pyvips.Image.thumbnail(image_path, size[0], height=size[1], size='down')
+                options = {}
+                if Path(output_path).suffix.lower() in ('.jpg', '.jpeg'):
+                    options = {'Q': 85, 'strip': True, 'optimize_coding': True}
+                thumb.write_to_file(output_path, **options)
+                return True
+            except pyvips.Error as e:
+                logger.warning(f"libvips thumbnail failed, falling back to Pillow: {e}")
+        
         try:
             with Image.open(image_path) as img:
                 img.thumbnail(size, Image.Resampling.LANCZOS)
@@ -500,27 +976,78 @@ class ImageProcessor:
             logger.error(f"Error creating thumbnail: {e}")
             return False
     
-    def batch_process_images(self, image_paths: List[str], analysis_types: List[AnalysisType] = None) -> List[ImageAnalysisResult]:
-        """Process multiple images in batch"""
-        results = []
-        for image_path in image_paths:
+    def batch_process_images(self, image_paths: List[str], analysis_types: List[AnalysisType] = None,
+                             max_workers: Optional[int] = None,
+                             use_processes: bool = False) -> List[ImageAnalysisResult]:
+        """Process multiple images in batch
+        
+        Images are analyzed in parallel threads; results keep the order of
+        image_paths. With use_processes set, large batches of CPU-heavy
+        images can run in spawned worker processes instead, configured with
+        this instance's OCR and size settings. Spawning needs the caller's
+        script to be importable (an `if __name__ == "__main__":` guard), so
+        if the pool cannot start or breaks, the batch is rerun on threads.
+        """
+        if len(image_paths) <= 1:
+            return [_analyze_for_batch(self, path, analysis_types) for path in image_paths]
+        
+        if use_processes:
             try:
-                result = self.comprehensive_analysis(image_path, analysis_types)
-                results.append(result)
-            except Exception as e:
-                results.append(ImageAnalysisResult(
-                    success=False,
-                    message=f"Failed to process {image_path}: {str(e)}"
-                ))
-        return results
+                with ProcessPoolExecutor(max_workers=max_workers,
+                                         mp_context=multiprocessing.get_context('spawn'),
+                                         initializer=_init_batch_worker,
+                                         initargs=(self._batch_settings(),)) as executor:
+                    return list(executor.map(
+                        _batch_worker, image_paths, [analysis_types] * len(image_paths)))
+            except (BrokenProcessPool, RuntimeError, OSError) as e:
+                logger.warning(f"Process pool unavailable, using threads: {e}")
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda path: _analyze_for_batch(self, path, analysis_types), image_paths))
+
+    def _batch_settings(self) -> Dict[str, Any]:
+        """Tunable settings copied into batch worker processes"""
+        return {
+            'max_image_size': self.max_image_size,
+            'max_dimensions': self.max_dimensions,
+            'ocr_max_height': self.ocr_max_height,
+            'ocr_config': self.ocr_config,
+        }
+
+def _analyze_for_batch(processor: ImageProcessor, image_path: str,
+                       analysis_types: Optional[List[AnalysisType]]) -> ImageAnalysisResult:
+    """Analyze one image, turning any error into a failed result"""
+    try:
+        return processor.comprehensive_analysis(image_path, analysis_types)
+    except Exception as e:
+        return ImageAnalysisResult(
+            success=False,
+            message=f"Failed to process {image_path}: {str(e)}"
+        )
+
+def _init_batch_worker(settings: Dict[str, Any]):
+    """Process-pool initializer; applies the parent processor's settings"""
+    for name, value in settings.items():
+        setattr(image_processor, name, value)
+
+def _batch_worker(image_path: str, analysis_types: Optional[List[AnalysisType]]) -> ImageAnalysisResult:
+    """Process-pool entry point; uses the worker process's own global processor"""
+    return _analyze_for_batch(image_processor, image_path, analysis_types)
 
 # Global instance
 image_processor = ImageProcessor()
 
 # Convenience functions for beginners
-def read_image(image_path: str) -> Dict[str, Any]:
-    """Simple image reading for beginners"""
-    result = image_processor.comprehensive_analysis(image_path)
+def read_image(image_path: str, *,
+               include: Tuple[AnalysisType, ...] = (AnalysisType.BASIC_INFO,)) -> Dict[str, Any]:
+    """Simple image reading for beginners
+    
+    Only the analyses listed in include are run (basic info by default);
+    add e.g. AnalysisType.COLOR_ANALYSIS or AnalysisType.QUALITY_ASSESSMENT
+    to fill in 'colors' and 'quality'.
+    """
+    result = image_processor.comprehensive_analysis(image_path, list(include))
     if not result.success:
         raise Exception(result.message)
     
@@ -64,6 +64,10 @@ setup(
             "accelerate>=0.20.0",
             "opencv-python>=4.6.0",
             "pytesseract>=0.3.10",
+            "pybase64>=1.2.0",
+            "pyvips>=2.2.0",
+            "xxhash>=3.0.0",
+            "uvloop>=0.17.0; sys_platform != 'win32'",
         ],
     },
     entry_points={
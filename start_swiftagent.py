@@ -6,30 +6,98 @@ Comprehensive startup script that initializes all components and provides multip
 
 import asyncio
 import argparse
+import hashlib
+import importlib.util
+import json
 import logging
 import os
+import site
 import sys
+import threading
 import time
 from pathlib import Path
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Setup logging (timestamps are only formatted in --debug mode)
+LOG_FORMAT = '%(levelname)s %(name)s: %(message)s'
+DEBUG_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
+CONFIG_DIR = Path.home() / ".config" / "swiftagent-toolkit"
+
+# Provider status symbols for show_status
+OK, BAD = "✅", "❌"
+
+# Packages whose bytecode is warmed in the background at startup
+WARM_PACKAGES = ("Core", "Tools", "Interface", "MCP", "Providers")
+
+def _warm_bytecode(root: Path):
+    """Compile stale package sources into __pycache__ without executing them"""
+    import py_compile
+    
+    # Sources that failed to compile, by path and mtime, so they are only
+    # retried once edited
+    failures_file = CONFIG_DIR / "bytecode-failures.json"
+    try:
+        failed = json.loads(failures_file.read_text())
+    except (OSError, ValueError):
+        failed = {}
+    still_failing = {}
+    
+    for package in WARM_PACKAGES:
+        for source in sorted((root / package).glob("*.py")):
+            path = str(source)
+            try:
+                mtime = os.stat(path).st_mtime
+                if failed.get(path) == mtime:
+                    still_failing[path] = mtime
+                    continue
+                
+                # A .pyc at least as new as its source is up to date: two
+                # stats per file in the steady state, no reads or compiles
+                cached = importlib.util.cache_from_source(path)
+                try:
+                    if os.stat(cached).st_mtime >= mtime:
+                        continue
+                except OSError:
+                    pass
+                
+                py_compile.compile(path, cfile=cached, doraise=True)
+            except py_compile.PyCompileError as e:
+                still_failing[path] = mtime
+                logger.debug("Bytecode warm-up skipped %s: %s", path, e.msg)
+            except OSError as e:
+                logger.debug("Bytecode warm-up skipped %s: %s", path, e)
+    
+    if still_failing != failed:
+        try:
+            tmp_file = failures_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps(still_failing))
+            os.replace(tmp_file, failures_file)
+        except OSError as e:
+            logger.debug("Could not record bytecode failures: %s", e)
+
 def setup_environment():
     """Setup the environment and check dependencies"""
     logger.info("Setting up SwiftAgent Toolkit environment...")
     
-    # Add current directory to Python path
+    # Add current directory to Python path unless the packages are already importable
+    # (running the script directly puts its directory on sys.path already)
     current_dir = Path(__file__).parent
-    sys.path.insert(0, str(current_dir))
+    if importlib.util.find_spec("Core") is None:
+        sys.path.insert(0, str(current_dir))
+    
+    # Check for required directories (skip the mkdir syscall once it exists)
+    if not os.path.isdir(CONFIG_DIR):
+        os.makedirs(CONFIG_DIR, exist_ok=True)
     
-    # Check for required directories
-    config_dir = Path.home() / ".config" / "swiftagent-toolkit"
-    config_dir.mkdir(parents=True, exist_ok=True)
+    # Compile the rest of the toolkit while the main thread keeps going
+    if not sys.dont_write_bytecode:
+        threading.Thread(
+            target=_warm_bytecode, args=(current_dir,),
+            name="bytecode-warmup", daemon=True
+        ).start()
     
     # Check Python version
     if sys.version_info < (3, 8):
@@ -38,127 +106,230 @@ def setup_environment():
     
     logger.info("Environment setup complete")
 
-def check_dependencies():
-    """Check if all required dependencies are available"""
-    logger.info("Checking dependencies...")
+REQUIRED_DEPS = ("aiohttp", "requests")
+
+OPTIONAL_DEPS = {
+    "fastapi": "Web backend",
+    "uvicorn": "Web server",
+    "PIL": "Image processing",
+    "cv2": "Advanced image processing",
+    "pytesseract": "OCR text extraction",
+    "mcp": "MCP server",
+    "uvloop": "Faster event loop"
+}
+
+# Optional dependencies each mode actually uses
+MODE_OPTIONAL_DEPS = {
+    "cli": ("PIL", "cv2", "pytesseract", "uvloop"),
+    "mcp": ("mcp", "PIL", "cv2", "pytesseract", "uvloop"),
+    "web": ("fastapi", "uvicorn", "PIL", "cv2", "pytesseract", "uvloop"),
+    "status": (),
+}
+
+def _depcheck_key() -> str:
+    """Fingerprint the interpreter, its site-packages and sys.path so installs invalidate the cache"""
+    try:
+        site_dirs = site.getsitepackages()
+    except AttributeError:
+        site_dirs = []
+    site_dirs = list(site_dirs) + [site.getusersitepackages()]
     
-    missing_deps = []
+    mtimes = []
+    for site_dir in site_dirs:
+        try:
+            mtimes.append(os.stat(site_dir).st_mtime)
+        except OSError:
+            continue
     
-    # Core dependencies
+    # sys.path covers packages found via PYTHONPATH or the script directory
+    signature = (sys.executable + sys.version + str(max(mtimes, default=0))
+                 + os.pathsep.join(sys.path))
+    return hashlib.sha1(signature.encode()).hexdigest()[:16]
+
+def _deps_sentinel(mode: str) -> Path:
+    """Marker written after a successful launch with this interpreter and sys.path"""
+    # Modes check different optional dependencies, so each gets its own marker
+    return CONFIG_DIR / f".deps-ok-{mode}-{_depcheck_key()}"
+
+def _mark_deps_ok(mode: str):
+    """Record that dependencies were fine so the next launch in this mode can skip the check"""
+    sentinel = _deps_sentinel(mode)
     try:
-        import aiohttp
-    except ImportError:
-        missing_deps.append("aiohttp")
+        for stale in CONFIG_DIR.glob(f".deps-ok-{mode}-*"):
+            if stale != sentinel:
+                stale.unlink()
+        sentinel.touch()
+    except OSError as e:
+        logger.debug("Could not write dependency sentinel: %s", e)
+
+def _probe_dependencies(use_cache: bool = True) -> dict:
+    """Return {module: installed} for every known dependency, cached per interpreter"""
+    names = REQUIRED_DEPS + tuple(OPTIONAL_DEPS)
+    cache_file = CONFIG_DIR / f"depcheck-{_depcheck_key()}.json"
     
-    try:
-        import requests
-    except ImportError:
-        missing_deps.append("requests")
-    
-    # Optional dependencies
-    optional_deps = {
-        "fastapi": "Web backend",
-        "uvicorn": "Web server",
-        "PIL": "Image processing",
-        "cv2": "Advanced image processing",
-        "pytesseract": "OCR text extraction",
-        "mcp": "MCP server"
+    if use_cache:
+        try:
+            cached = json.loads(cache_file.read_text())
+            if isinstance(cached, dict) and all(name in cached for name in names):
+                return cached
+        except (OSError, ValueError):
+            pass
+    
+    # Already-imported modules need no lookup; find_spec only locates the rest
+    found = {
+        name: name in sys.modules or importlib.util.find_spec(name) is not None
+        for name in names
     }
     
-    missing_optional = []
-    for dep, description in optional_deps.items():
-        try:
-            if dep == "PIL":
-                import PIL
-            elif dep == "cv2":
-                import cv2
-            elif dep == "pytesseract":
-                import pytesseract
-            elif dep == "mcp":
-                import mcp
-            else:
-                __import__(dep)
-        except ImportError:
-            missing_optional.append(f"{dep} ({description})")
+    try:
+        for stale in CONFIG_DIR.glob("depcheck-*.json"):
+            if stale != cache_file:
+                stale.unlink()
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(found))
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug("Could not write dependency cache: %s", e)
+    
+    return found
+
+def check_dependencies(mode: str = None, use_cache: bool = True):
+    """Check if all required dependencies are available for the given mode"""
+    logger.info("Checking dependencies...")
+    
+    found = _probe_dependencies(use_cache)
+    missing_deps = [dep for dep in REQUIRED_DEPS if not found[dep]]
+    
+    optional_deps = OPTIONAL_DEPS
+    if mode is not None:
+        wanted = MODE_OPTIONAL_DEPS.get(mode, ())
+        optional_deps = {dep: OPTIONAL_DEPS[dep] for dep in wanted}
+    
+    missing_optional = [
+        f"{dep} ({description})"
+        for dep, description in optional_deps.items()
+        if not found[dep]
+    ]
     
     if missing_deps:
-        logger.error(f"Missing required dependencies: {', '.join(missing_deps)}")
+        logger.error("Missing required dependencies: %s", ", ".join(missing_deps))
         logger.error("Install with: pip install -r requirements.txt")
         sys.exit(1)
     
     if missing_optional:
-        logger.warning(f"Missing optional dependencies: {', '.join(missing_optional)}")
+        logger.warning("Missing optional dependencies: %s", ", ".join(missing_optional))
         logger.info("Some features may not be available")
     
     logger.info("Dependency check complete")
 
+# Subsystems the toolkit can run without: (module, singleton attribute)
+OPTIONAL_COMPONENTS = (
+    ("Core.memory_system", "memory_system"),
+    ("Core.self_healing", "self_healing"),
+    ("Tools.file_operations", "file_ops"),
+    ("Tools.image_processor", "image_processor"),
+)
+
+# Subsystems reported by --mode status
+STATUS_COMPONENTS = (
+    ("Core.memory_system", "memory_system"),
+    ("Core.self_healing", "self_healing"),
+)
+
+def _import_component(module: str, attr: str):
+    """Import a synchronous subsystem (its singleton loads state on import)"""
+    return getattr(importlib.import_module(module), attr)
+
+def _collect_components(specs, results) -> dict:
+    """Map loaded subsystems by name, warning about the ones that failed"""
+    components = {}
+    for (module, attr), result in zip(specs, results):
+        if isinstance(result, Exception):
+            logger.warning("%s failed to initialize, continuing without it: %s", module, result)
+        else:
+            components[attr] = result
+    return components
+
+def _load_providers():
+    """Import the LLM manager and build the configured providers"""
+    from Core.llm_manager import llm_manager
+    return llm_manager.load_configs()
+
 async def initialize_components():
     """Initialize all toolkit components"""
     logger.info("Initializing SwiftAgent Toolkit components...")
     
-    try:
-        # Import components
-        from Core.llm_manager import llm_manager
-        from Core.memory_system import memory_system
-        from Core.self_healing import self_healing
-        from Core.load_balancer import load_balancer
-        from Tools.file_operations import file_ops
-        from Tools.image_processor import image_processor
-        
-        # Initialize LLM providers
-        await llm_manager.initialize_providers()
-        logger.info(f"Initialized {len(llm_manager.providers)} LLM providers")
-        
-        # Add providers to load balancer
-        for name, provider in llm_manager.providers.items():
-            load_balancer.add_provider(name, provider)
-        logger.info(f"Added {len(load_balancer.providers)} providers to load balancer")
-        
-        # Check memory system
-        logger.info(f"Memory system: {len(memory_system.memories)} memories loaded")
-        
-        # Check file operations
-        logger.info(f"File operations: {len(file_ops.security.safe_directories)} safe directories")
-        
-        # Check image processing
-        capabilities = image_processor.capabilities
-        logger.info(f"Image processing capabilities: {capabilities}")
-        
-        return True
-        
-    except Exception as e:
-        logger.error(f"Failed to initialize components: {e}")
+    # The packages re-export lazily, so the LLM providers and each optional
+    # subsystem import (and construct) independently in worker threads
+    loop = asyncio.get_running_loop()
+    providers, *loaded = await asyncio.gather(
+        loop.run_in_executor(None, _load_providers),
+        *(loop.run_in_executor(None, _import_component, module, attr)
+          for module, attr in OPTIONAL_COMPONENTS),
+        return_exceptions=True
+    )
+    
+    # LLM providers are critical: without them there is nothing to route to
+    if isinstance(providers, Exception):
+        logger.error("Failed to initialize LLM providers: %s", providers)
         return False
+    logger.info("Initialized %d LLM providers", len(providers))
+    
+    # Add providers to load balancer (add_providers logs the count)
+    from Core.load_balancer import load_balancer
+    load_balancer.add_providers(providers)
+    
+    components = _collect_components(OPTIONAL_COMPONENTS, loaded)
+    
+    # Check memory system
+    if "memory_system" in components:
+        logger.info("Memory system: %d memories loaded", len(components["memory_system"].memories))
+    
+    # Check file operations
+    if "file_ops" in components:
+        logger.info("File operations: %d safe directories",
+                    len(components["file_ops"].security.safe_directories))
+    
+    # Check image processing
+    if "image_processor" in components and logger.isEnabledFor(logging.INFO):
+        logger.info("Image processing capabilities: %s", components["image_processor"].capabilities)
+    
+    if len(components) < len(OPTIONAL_COMPONENTS):
+        logger.warning("Running in degraded mode without: %s", ", ".join(
+            attr for _, attr in OPTIONAL_COMPONENTS if attr not in components
+        ))
+    
+    return True
 
-def start_cli():
+async def start_cli():
     """Start the command-line interface"""
     logger.info("Starting CLI interface...")
     
     try:
-        from Interface.cli import main as cli_main
-        cli_main()
+        from Interface.cli import BeginnerCLI
+        await BeginnerCLI().interactive_mode()
     except Exception as e:
-        logger.error(f"Failed to start CLI: {e}")
+        logger.error("Failed to start CLI: %s", e)
 
-def start_mcp_server():
+async def start_mcp_server():
     """Start the MCP server"""
     logger.info("Starting MCP server...")
     
     try:
         from MCP.mcp_server import main as mcp_main
-        asyncio.run(mcp_main())
+        await mcp_main()
     except Exception as e:
-        logger.error(f"Failed to start MCP server: {e}")
+        logger.error("Failed to start MCP server: %s", e)
 
-def start_web_backend():
+async def start_web_backend(host: str, port: int):
     """Start the web backend server"""
     logger.info("Starting web backend...")
     
     try:
-        from Interface.web_backend import main as web_main
-        web_main()
+        from Interface.web_backend import serve
+        await serve(host=host, port=port)
     except Exception as e:
-        logger.error(f"Failed to start web backend: {e}")
+        logger.error("Failed to start web backend: %s", e)
 
 def show_status():
     """Show system status"""
@@ -166,43 +337,96 @@ def show_status():
     
     try:
         from Core.llm_manager import llm_manager
-        from Core.memory_system import memory_system
-        from Core.self_healing import self_healing
         from Core.load_balancer import load_balancer
         
-        print("\n" + "="*50)
-        print("SwiftAgent Toolkit Status")
-        print("="*50)
+        # Sections for subsystems that fail to import are left out
+        loaded = []
+        for module, attr in STATUS_COMPONENTS:
+            try:
+                loaded.append(_import_component(module, attr))
+            except Exception as e:
+                loaded.append(e)
+        components = _collect_components(STATUS_COMPONENTS, loaded)
+        
+        # Building providers is synchronous and makes no network calls,
+        # so status can list them without starting an event loop
+        llm_manager.load_configs()
+        load_balancer.add_providers(llm_manager.providers)
+        
+        out = ["", "="*50, "SwiftAgent Toolkit Status", "="*50]
         
         # LLM Providers
-        print(f"\n🤖 LLM Providers: {len(llm_manager.providers)}")
-        for name, provider in llm_manager.providers.items():
-            status = "✅" if provider.config.enabled else "❌"
-            print(f"  {status} {name} ({provider.config.type.value})")
+        out.append(f"\n🤖 LLM Providers: {len(llm_manager.providers)}")
+        out.extend(
+            f"  {OK if enabled else BAD} {name} ({type_value})"
+            for name, enabled, type_value in zip(
+                llm_manager.provider_names,
+                llm_manager.provider_enabled,
+                llm_manager.provider_type_values
+            )
+        )
         
         # Memory System
-        print(f"\n🧠 Memory System: {len(memory_system.memories)} memories")
-        print(f"  Conversations: {len(memory_system.conversations)}")
-        print(f"  Preferences: {len(memory_system.preferences)}")
+        if "memory_system" in components:
+            memory_system = components["memory_system"]
+            out.append(f"\n🧠 Memory System: {len(memory_system.memories)} memories")
+            out.append(f"  Conversations: {len(memory_system.conversations)}")
+            out.append(f"  Preferences: {len(memory_system.preferences)}")
         
         # Self Healing
-        error_summary = self_healing.get_error_summary()
-        perf_summary = self_healing.get_performance_summary()
-        print(f"\n🔧 Self Healing:")
-        print(f"  Recent errors: {error_summary['total_errors']}")
-        print(f"  Resolution rate: {error_summary['resolution_rate']:.1%}")
-        print(f"  Performance metrics: {perf_summary['total_operations']}")
+        if "self_healing" in components:
+            self_healing = components["self_healing"]
+            out.append("\n🔧 Self Healing:")
+            out.append(f"  Recorded errors: {self_healing.error_count}")
+            out.append(f"  Resolution rate: {self_healing.resolution_rate:.1%}")
+            out.append(f"  Performance metrics: {self_healing.operation_count}")
         
         # Load Balancer
         lb_stats = load_balancer.get_stats()
-        print(f"\n⚖️ Load Balancer:")
-        print(f"  Strategy: {lb_stats['strategy']}")
-        print(f"  Available providers: {lb_stats['available_providers']}/{lb_stats['total_providers']}")
+        out.append("\n⚖️ Load Balancer:")
+        out.append(f"  Strategy: {lb_stats['strategy']}")
+        out.append(f"  Available providers: {lb_stats['available_providers']}/{lb_stats['total_providers']}")
         
-        print("\n" + "="*50)
+        out.append("\n" + "="*50)
+        
+        # One write instead of a print per line
+        sys.stdout.write("\n".join(out) + "\n")
         
     except Exception as e:
-        logger.error(f"Failed to show status: {e}")
+        logger.error("Failed to show status: %s", e)
+
+def _available_cpus() -> int:
+    """CPUs this process may run on (respects affinity masks and cpusets)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+async def run_async(args) -> bool:
+    """Initialize components and run the requested mode on one event loop"""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    # Size the default executor to the CPUs we can actually use rather than
+    # asyncio's cpu_count() + 4; keep two threads so DNS lookups aren't starved
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=max(2, _available_cpus()))
+    )
+    
+    if not await initialize_components():
+        return False
+    _mark_deps_ok(args.mode)
+    
+    if args.mode == "cli":
+        await start_cli()
+    elif args.mode == "mcp":
+        await start_mcp_server()
+    elif args.mode == "web":
+        await start_web_backend(args.host, args.port)
+    else:
+        logger.error("Unknown mode: %s", args.mode)
+        sys.exit(1)
+    
+    return True
 
 def main():
     """Main entry point"""
@@ -212,36 +436,41 @@ def main():
     parser.add_argument("--port", type=int, default=8000, help="Web server port")
     parser.add_argument("--host", default="0.0.0.0", help="Web server host")
     parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+    parser.add_argument("--force-check", action="store_true",
+                       help="Re-run the dependency check even after a successful launch")
     
     args = parser.parse_args()
     
     if args.debug:
-        logging.getLogger().setLevel(logging.DEBUG)
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.DEBUG)
+        for handler in root_logger.handlers:
+            handler.setFormatter(logging.Formatter(DEBUG_LOG_FORMAT))
     
     # Setup environment
     setup_environment()
-    check_dependencies()
-    
-    # Initialize components
-    if not asyncio.run(initialize_components()):
-        logger.error("Failed to initialize components. Exiting.")
-        sys.exit(1)
+    if args.force_check or not _deps_sentinel(args.mode).exists():
+        check_dependencies(args.mode, use_cache=not args.force_check)
+    else:
+        logger.debug("Skipping dependency check (last launch succeeded)")
     
-    # Start requested mode
-    if args.mode == "cli":
-        start_cli()
-    elif args.mode == "mcp":
-        start_mcp_server()
-    elif args.mode == "web":
-        # Set environment variables for web server
-        os.environ["HOST"] = args.host
-        os.environ["PORT"] = str(args.port)
-        start_web_backend()
-    elif args.mode == "status":
+    # Status only reads counters, so skip provider initialization
+    if args.mode == "status":
         show_status()
-    else:
-        logger.error(f"Unknown mode: {args.mode}")
+        return
+    
+    # Prefer the libuv-based loop when it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.debug("Using uvloop event loop")
+    except ImportError:
+        pass
+    
+    # Initialize components and start requested mode
+    if not asyncio.run(run_async(args)):
+        logger.error("Failed to initialize components. Exiting.")
         sys.exit(1)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()